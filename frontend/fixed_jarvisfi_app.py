@@ -5,10 +5,12 @@ Fixed JarvisFi Application - Debugging and fixing issues
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 import time
 import json
+import random
 from datetime import datetime, timedelta
 from typing import Dict, List, Any
 import logging
@@ -17,14 +19,155 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Simulated voice recognition samples (shared across reruns)
+_SAMPLE_QUERIES = (
+    "What's my budget status?",
+    "How should I invest 10000 rupees?",
+    "Calculate SIP for retirement planning"
+)
+
+
+@st.cache_data
+def _msp_df() -> pd.DataFrame:
+    """Build the static MSP table once and reuse it across reruns"""
+    return pd.DataFrame({
+        'Crop': ['Rice', 'Wheat', 'Cotton', 'Sugarcane', 'Maize', 'Bajra'],
+        'MSP (₹/Quintal)': [2183, 2275, 6620, 315, 2090, 2500],
+        'Season': ['Kharif', 'Rabi', 'Kharif', 'Annual', 'Kharif', 'Kharif']
+    })
+
+# Currency formatter bound once so the format spec is not re-parsed per call
+_INR = "₹{:,.0f}".format
+
+# Static page content (rendered as-is or via str.format)
+_INVEST_RECS_TMPL = (
+    "💰 Current SIP: ₹{sip:,.0f} (15% of income) - Good allocation!",
+    "📈 Consider adding international equity exposure for diversification",
+    "🏦 Rebalance portfolio quarterly to maintain target allocation",
+    "💎 Current gold allocation: 5% - Consider increasing to 10% for stability"
+)
+
+_CREDIT_RECS = (
+    "💳 Keep credit utilization below 30%",
+    "⏰ Pay all bills on time",
+    "📅 Don't close old credit cards",
+    "🔍 Check credit report regularly",
+    "💰 Pay more than minimum amounts"
+)
+
+_SCHEMES = (
+    {
+        'name': 'PM-KISAN',
+        'benefit': '₹6,000 per year',
+        'eligibility': 'Small and marginal farmers',
+        'status': 'Active'
+    },
+    {
+        'name': 'Pradhan Mantri Fasal Bima Yojana',
+        'benefit': 'Crop insurance coverage',
+        'eligibility': 'All farmers',
+        'status': 'Active'
+    }
+)
+
+# Credit score gauge bands (300-850 scale)
+_GAUGE_STEPS = (
+    {'range': [300, 550], 'color': "red"},
+    {'range': [550, 650], 'color': "orange"},
+    {'range': [650, 750], 'color': "yellow"},
+    {'range': [750, 850], 'color': "green"}
+)
+
+
+@st.cache_resource
+def _credit_gauge_figure() -> go.Figure:
+    """Build the credit score gauge once per process
+
+    Shared by every session, so callers copy it with go.Figure(template)
+    before setting the value and never write to the cached figure.
+    """
+    fig = go.Figure(go.Indicator(
+        mode = "gauge+number",
+        value = 300,
+        domain = {'x': [0, 1], 'y': [0, 1]},
+        title = {'text': "Credit Score"},
+        gauge = {
+            'axis': {'range': [300, 850]},
+            'bar': {'color': "darkblue"},
+            'steps': list(_GAUGE_STEPS)
+        }
+    ))
+    fig.update_layout(height=300)
+    return fig
+
+
+@st.cache_data(ttl=600, max_entries=256)
+def _cached_response_content(prompt: str, language: str,
+                             monthly_income: int, monthly_expenses: int) -> str:
+    """Keyword-based response text, memoized on the query, language and
+    the profile figures it depends on"""
+    savings = monthly_income - monthly_expenses
+    savings_rate = (savings / monthly_income * 100) if monthly_income > 0 else 0
+
+    # Simple keyword-based responses
+    prompt_lower = prompt.lower()
+
+    if 'savings rate' in prompt_lower or 'சேமிப்பு விகிதம்' in prompt_lower:
+        if language == 'ta':
+            content = f"உங்கள் தற்போதைய சேமிப்பு விகிதம் {savings_rate:.1f}%. இது {'சிறந்தது' if savings_rate >= 20 else 'நல்லது' if savings_rate >= 10 else 'மேம்படுத்த வேண்டும்'}."
+        else:
+            content = f"Your current savings rate is {savings_rate:.1f}%. This is {'excellent' if savings_rate >= 20 else 'good' if savings_rate >= 10 else 'needs improvement'}."
+
+    elif 'invest' in prompt_lower or 'முதலீடு' in prompt_lower:
+        recommended_sip = int(monthly_income * 0.15)
+        if language == 'ta':
+            content = f"உங்கள் வருமானத்தின் அடிப்படையில், மாதம் ₹{recommended_sip:,} SIP முதலீடு செய்வது நல்லது (வருமானத்தின் 15%)."
+        else:
+            content = f"Based on your income, I recommend investing ₹{recommended_sip:,} monthly through SIP (15% of income)."
+
+    elif 'retirement' in prompt_lower or 'ஓய்வூதியம்' in prompt_lower:
+        retirement_corpus = monthly_income * 12 * 25
+        if language == 'ta':
+            content = f"ஓய்வூதியத்திற்கு தேவையான நிதி தோராயமாக ₹{retirement_corpus:,} (வருடாந்திர செலவின் 25 மடங்கு)."
+        else:
+            content = f"For retirement, you'll need approximately ₹{retirement_corpus:,} (25x annual expenses)."
+
+    elif 'tax' in prompt_lower or 'வரி' in prompt_lower:
+        if language == 'ta':
+            content = "வரி சேமிப்பு விருப்பங்கள்: ELSS (₹1.5 லட்சம் வரை), PPF, NSC, வீட்டுக் கடன் வட்டி."
+        else:
+            content = "Tax-saving options: ELSS (up to ₹1.5 lakh), PPF, NSC, home loan interest deduction."
+
+    else:
+        if language == 'ta':
+            content = "நான் உங்களுக்கு நிதி ஆலோசனை வழங்க இங்கே இருக்கிறேன். குறிப்பிட்ட கேள்விகள் கேளுங்கள்!"
+        else:
+            content = "I'm here to help with your financial questions. Please ask specific questions about savings, investments, or financial planning!"
+
+    return content
+
 class FixedJarvisFiApp:
     """Fixed JarvisFi Application with debugging and error handling"""
     
     def __init__(self):
-        """Initialize the application"""
+        """Initialize the application
+
+        The instance is shared across sessions (see ``_get_app``), so
+        per-session setup happens at the start of ``run`` instead.
+        """
         self.logger = logger
-        self.setup_page_config()
-        self.initialize_session_state()
+
+        # Page dispatch table used by run()
+        self._pages = {
+            'home': self.render_home_page,
+            'dashboard': self.render_dashboard_page,
+            'chat': self.render_chat_page,
+            'calculators': self.render_calculators_page,
+            'investments': self.render_investments_page,
+            'credit': self.render_credit_page,
+            'farmer': self.render_farmer_page,
+            'voice': self.render_voice_page
+        }
     
     def setup_page_config(self):
         """Setup Streamlit page configuration"""
@@ -120,13 +263,15 @@ class FixedJarvisFiApp:
                 
                 # User profile section
                 profile = st.session_state.user_profile
+                basic = profile['basic_info']
+                financial = profile['financial_profile']
                 st.markdown("---")
                 st.markdown("### 👤 User Profile")
                 
                 # Editable user information
-                new_name = st.text_input("Name", value=profile['basic_info']['name'])
-                if new_name != profile['basic_info']['name']:
-                    st.session_state.user_profile['basic_info']['name'] = new_name
+                new_name = st.text_input("Name", value=basic['name'])
+                if new_name != basic['name']:
+                    basic['name'] = new_name
                     st.success("Name updated!")
                     st.rerun()
                 
@@ -134,11 +279,11 @@ class FixedJarvisFiApp:
                     "Monthly Income (₹)",
                     min_value=5000,
                     max_value=1000000,
-                    value=profile['basic_info']['monthly_income'],
+                    value=basic['monthly_income'],
                     step=5000
                 )
-                if new_income != profile['basic_info']['monthly_income']:
-                    st.session_state.user_profile['basic_info']['monthly_income'] = new_income
+                if new_income != basic['monthly_income']:
+                    basic['monthly_income'] = new_income
                     st.success(f"Income updated to ₹{new_income:,}!")
                     st.rerun()
                 
@@ -146,11 +291,11 @@ class FixedJarvisFiApp:
                     "Monthly Expenses (₹)",
                     min_value=1000,
                     max_value=500000,
-                    value=profile['financial_profile']['monthly_expenses'],
+                    value=financial['monthly_expenses'],
                     step=1000
                 )
-                if new_expenses != profile['financial_profile']['monthly_expenses']:
-                    st.session_state.user_profile['financial_profile']['monthly_expenses'] = new_expenses
+                if new_expenses != financial['monthly_expenses']:
+                    financial['monthly_expenses'] = new_expenses
                     st.success(f"Expenses updated to ₹{new_expenses:,}!")
                     st.rerun()
                 
@@ -166,11 +311,11 @@ class FixedJarvisFiApp:
                     "Language",
                     options=list(languages.keys()),
                     format_func=lambda x: languages[x],
-                    index=list(languages.keys()).index(profile['basic_info']['language'])
+                    index=list(languages.keys()).index(basic['language'])
                 )
                 
-                if selected_lang != profile['basic_info']['language']:
-                    st.session_state.user_profile['basic_info']['language'] = selected_lang
+                if selected_lang != basic['language']:
+                    basic['language'] = selected_lang
                     st.success("Language updated!")
                     st.rerun()
                 
@@ -186,11 +331,11 @@ class FixedJarvisFiApp:
                     "User Type",
                     options=list(user_types.keys()),
                     format_func=lambda x: user_types[x],
-                    index=list(user_types.keys()).index(profile['basic_info']['user_type'])
+                    index=list(user_types.keys()).index(basic['user_type'])
                 )
                 
-                if selected_type != profile['basic_info']['user_type']:
-                    st.session_state.user_profile['basic_info']['user_type'] = selected_type
+                if selected_type != basic['user_type']:
+                    basic['user_type'] = selected_type
                     st.success("User type updated!")
                     st.rerun()
                 
@@ -223,14 +368,14 @@ class FixedJarvisFiApp:
                 
                 # Quick stats
                 st.markdown("### 📊 Quick Stats")
-                monthly_income = profile['basic_info']['monthly_income']
-                monthly_expenses = profile['financial_profile']['monthly_expenses']
+                monthly_income = basic['monthly_income']
+                monthly_expenses = financial['monthly_expenses']
                 savings = monthly_income - monthly_expenses
                 savings_rate = (savings / monthly_income * 100) if monthly_income > 0 else 0
                 
-                st.metric("💰 Monthly Savings", f"₹{savings:,}")
+                st.metric("💰 Monthly Savings", _INR(savings))
                 st.metric("📈 Savings Rate", f"{savings_rate:.1f}%")
-                st.metric("💳 Credit Score", profile['financial_profile']['credit_score'])
+                st.metric("💳 Credit Score", financial['credit_score'])
                 
         except Exception as e:
             self.logger.error(f"Sidebar rendering failed: {e}")
@@ -240,8 +385,10 @@ class FixedJarvisFiApp:
         """Render home page"""
         try:
             profile = st.session_state.user_profile
-            current_lang = profile['basic_info']['language']
-            user_name = profile['basic_info']['name']
+            basic = profile['basic_info']
+            financial = profile['financial_profile']
+            current_lang = basic['language']
+            user_name = basic['name']
             
             # Welcome message
             welcome_messages = {
@@ -255,23 +402,23 @@ class FixedJarvisFiApp:
             st.markdown("### 🏠 Financial Dashboard Overview")
             
             # Financial overview cards
-            monthly_income = profile['basic_info']['monthly_income']
-            monthly_expenses = profile['financial_profile']['monthly_expenses']
+            monthly_income = basic['monthly_income']
+            monthly_expenses = financial['monthly_expenses']
             savings = monthly_income - monthly_expenses
-            credit_score = profile['financial_profile']['credit_score']
+            credit_score = financial['credit_score']
             savings_rate = (savings / monthly_income * 100) if monthly_income > 0 else 0
             
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("💰 Monthly Income", f"₹{monthly_income:,}", help="Your current monthly income")
+                st.metric("💰 Monthly Income", _INR(monthly_income), help="Your current monthly income")
             
             with col2:
-                st.metric("💸 Monthly Expenses", f"₹{monthly_expenses:,}", help="Your monthly expenses")
+                st.metric("💸 Monthly Expenses", _INR(monthly_expenses), help="Your monthly expenses")
             
             with col3:
                 delta_color = "normal" if savings > 0 else "inverse"
-                st.metric("💰 Monthly Savings", f"₹{savings:,}", f"{savings_rate:.1f}%", delta_color=delta_color)
+                st.metric("💰 Monthly Savings", _INR(savings), f"{savings_rate:.1f}%", delta_color=delta_color)
             
             with col4:
                 score_status = "Excellent" if credit_score >= 750 else "Good" if credit_score >= 650 else "Fair"
@@ -361,9 +508,11 @@ class FixedJarvisFiApp:
     def get_recommendations(self, profile: Dict) -> List[str]:
         """Get personalized recommendations"""
         try:
-            user_type = profile['basic_info']['user_type']
-            monthly_income = profile['basic_info']['monthly_income']
-            monthly_expenses = profile['financial_profile']['monthly_expenses']
+            basic = profile['basic_info']
+            financial = profile['financial_profile']
+            user_type = basic['user_type']
+            monthly_income = basic['monthly_income']
+            monthly_expenses = financial['monthly_expenses']
             savings = monthly_income - monthly_expenses
             savings_rate = (savings / monthly_income * 100) if monthly_income > 0 else 0
             
@@ -412,8 +561,10 @@ class FixedJarvisFiApp:
             st.markdown("# 📊 Financial Dashboard")
 
             profile = st.session_state.user_profile
-            monthly_income = profile['basic_info']['monthly_income']
-            monthly_expenses = profile['financial_profile']['monthly_expenses']
+            basic = profile['basic_info']
+            financial = profile['financial_profile']
+            monthly_income = basic['monthly_income']
+            monthly_expenses = financial['monthly_expenses']
             savings = monthly_income - monthly_expenses
 
             # Key metrics with real-time updates
@@ -421,14 +572,14 @@ class FixedJarvisFiApp:
 
             with col1:
                 net_worth = savings * 12 + 100000  # Estimated
-                st.metric("💰 Net Worth", f"₹{net_worth:,}", "↗️ +15%")
+                st.metric("💰 Net Worth", _INR(net_worth), "↗️ +15%")
 
             with col2:
                 investments = monthly_income * 0.15 * 12  # 15% of income
-                st.metric("📈 Investments", f"₹{investments:,}", "↗️ +8%")
+                st.metric("📈 Investments", _INR(investments), "↗️ +8%")
 
             with col3:
-                st.metric("💳 Credit Score", profile['financial_profile']['credit_score'], "↗️ +25")
+                st.metric("💳 Credit Score", financial['credit_score'], "↗️ +25")
 
             with col4:
                 goal_progress = min(65 + (savings / 1000), 100)  # Dynamic progress
@@ -480,10 +631,10 @@ class FixedJarvisFiApp:
                     st.progress(progress / 100)
 
                 with col2:
-                    st.metric("Current", f"₹{goal['current']:,.0f}")
+                    st.metric("Current", _INR(goal['current']))
 
                 with col3:
-                    st.metric("Target", f"₹{goal['target']:,.0f}")
+                    st.metric("Target", _INR(goal['target']))
 
                 if progress >= 80:
                     st.success(f"🎉 {progress:.1f}% complete - Almost there!")
@@ -580,45 +731,11 @@ class FixedJarvisFiApp:
         """Generate AI response (simplified version)"""
         try:
             profile = st.session_state.user_profile
-            monthly_income = profile['basic_info']['monthly_income']
-            monthly_expenses = profile['financial_profile']['monthly_expenses']
-            savings = monthly_income - monthly_expenses
-            savings_rate = (savings / monthly_income * 100) if monthly_income > 0 else 0
-
-            # Simple keyword-based responses
-            prompt_lower = prompt.lower()
-
-            if 'savings rate' in prompt_lower or 'சேமிப்பு விகிதம்' in prompt_lower:
-                if language == 'ta':
-                    content = f"உங்கள் தற்போதைய சேமிப்பு விகிதம் {savings_rate:.1f}%. இது {'சிறந்தது' if savings_rate >= 20 else 'நல்லது' if savings_rate >= 10 else 'மேம்படுத்த வேண்டும்'}."
-                else:
-                    content = f"Your current savings rate is {savings_rate:.1f}%. This is {'excellent' if savings_rate >= 20 else 'good' if savings_rate >= 10 else 'needs improvement'}."
-
-            elif 'invest' in prompt_lower or 'முதலீடு' in prompt_lower:
-                recommended_sip = int(monthly_income * 0.15)
-                if language == 'ta':
-                    content = f"உங்கள் வருமானத்தின் அடிப்படையில், மாதம் ₹{recommended_sip:,} SIP முதலீடு செய்வது நல்லது (வருமானத்தின் 15%)."
-                else:
-                    content = f"Based on your income, I recommend investing ₹{recommended_sip:,} monthly through SIP (15% of income)."
-
-            elif 'retirement' in prompt_lower or 'ஓய்வூதியம்' in prompt_lower:
-                retirement_corpus = monthly_income * 12 * 25
-                if language == 'ta':
-                    content = f"ஓய்வூதியத்திற்கு தேவையான நிதி தோராயமாக ₹{retirement_corpus:,} (வருடாந்திர செலவின் 25 மடங்கு)."
-                else:
-                    content = f"For retirement, you'll need approximately ₹{retirement_corpus:,} (25x annual expenses)."
-
-            elif 'tax' in prompt_lower or 'வரி' in prompt_lower:
-                if language == 'ta':
-                    content = "வரி சேமிப்பு விருப்பங்கள்: ELSS (₹1.5 லட்சம் வரை), PPF, NSC, வீட்டுக் கடன் வட்டி."
-                else:
-                    content = "Tax-saving options: ELSS (up to ₹1.5 lakh), PPF, NSC, home loan interest deduction."
-
-            else:
-                if language == 'ta':
-                    content = "நான் உங்களுக்கு நிதி ஆலோசனை வழங்க இங்கே இருக்கிறேன். குறிப்பிட்ட கேள்விகள் கேளுங்கள்!"
-                else:
-                    content = "I'm here to help with your financial questions. Please ask specific questions about savings, investments, or financial planning!"
+            content = _cached_response_content(
+                prompt, language,
+                profile['basic_info']['monthly_income'],
+                profile['financial_profile']['monthly_expenses']
+            )
 
             return {
                 'role': 'assistant',
@@ -674,26 +791,23 @@ class FixedJarvisFiApp:
                     total_invested = monthly_sip * total_months
                     total_returns = future_value - total_invested
 
-                    st.metric("Total Investment", f"₹{total_invested:,.0f}")
-                    st.metric("Expected Returns", f"₹{total_returns:,.0f}")
-                    st.metric("Maturity Amount", f"₹{future_value:,.0f}")
-
-                # Chart
-                years = list(range(1, investment_period + 1))
-                invested_amounts = [monthly_sip * 12 * year for year in years]
-                maturity_amounts = []
-
-                for year in years:
-                    months = year * 12
-                    if monthly_return > 0:
-                        amount = monthly_sip * (((1 + monthly_return) ** months - 1) / monthly_return) * (1 + monthly_return)
-                    else:
-                        amount = monthly_sip * months
-                    maturity_amounts.append(amount)
+                    st.metric("Total Investment", _INR(total_invested))
+                    st.metric("Expected Returns", _INR(total_returns))
+                    st.metric("Maturity Amount", _INR(future_value))
+
+                # Chart: invested (col 0) and maturity (col 1) share one buffer
+                years = np.arange(1, investment_period + 1)
+                months = years * 12
+                series = np.empty((years.size, 2))
+                series[:, 0] = monthly_sip * months
+                if monthly_return > 0:
+                    series[:, 1] = monthly_sip * (((1 + monthly_return) ** months - 1) / monthly_return) * (1 + monthly_return)
+                else:
+                    series[:, 1] = series[:, 0]
 
                 fig = go.Figure()
-                fig.add_trace(go.Scatter(x=years, y=invested_amounts, name='Total Invested', fill='tonexty'))
-                fig.add_trace(go.Scatter(x=years, y=maturity_amounts, name='Maturity Value', fill='tonexty'))
+                fig.add_trace(go.Scatter(x=years, y=series[:, 0], name='Total Invested', fill='tonexty'))
+                fig.add_trace(go.Scatter(x=years, y=series[:, 1], name='Maturity Value', fill='tonexty'))
                 fig.update_layout(title='SIP Growth Over Time', xaxis_title='Years', yaxis_title='Amount (₹)')
                 st.plotly_chart(fig, use_container_width=True)
 
@@ -720,9 +834,9 @@ class FixedJarvisFiApp:
                     total_payment = emi * total_months
                     total_interest = total_payment - loan_amount
 
-                    st.metric("Monthly EMI", f"₹{emi:,.0f}")
-                    st.metric("Total Interest", f"₹{total_interest:,.0f}")
-                    st.metric("Total Payment", f"₹{total_payment:,.0f}")
+                    st.metric("Monthly EMI", _INR(emi))
+                    st.metric("Total Interest", _INR(total_interest))
+                    st.metric("Total Payment", _INR(total_payment))
 
                 # EMI breakdown chart
                 fig = go.Figure(data=[
@@ -744,7 +858,8 @@ class FixedJarvisFiApp:
             st.markdown("# 📈 Investment Portfolio")
 
             profile = st.session_state.user_profile
-            monthly_income = profile['basic_info']['monthly_income']
+            basic = profile['basic_info']
+            monthly_income = basic['monthly_income']
 
             # Portfolio overview with dynamic values
             col1, col2, col3, col4 = st.columns(4)
@@ -756,9 +871,9 @@ class FixedJarvisFiApp:
             goal_progress = min(68 + (monthly_income / 10000), 100)
 
             with col1:
-                st.metric("Total Portfolio", f"₹{total_portfolio:,.0f}", "↗️ +12%")
+                st.metric("Total Portfolio", _INR(total_portfolio), "↗️ +12%")
             with col2:
-                st.metric("Monthly SIP", f"₹{monthly_sip:,.0f}", f"↗️ +₹{monthly_sip*0.1:,.0f}")
+                st.metric("Monthly SIP", _INR(monthly_sip), f"↗️ +₹{monthly_sip*0.1:,.0f}")
             with col3:
                 st.metric("Returns (1Y)", f"{annual_returns}%", "↗️ +2.1%")
             with col4:
@@ -784,7 +899,7 @@ class FixedJarvisFiApp:
 
             with col2:
                 # Recommended allocation based on age
-                user_age = profile['basic_info']['age']
+                user_age = basic['age']
                 equity_percent = min(100 - user_age, 80)
                 debt_percent = 100 - equity_percent
 
@@ -800,17 +915,8 @@ class FixedJarvisFiApp:
             # Investment recommendations
             st.markdown("#### 💡 Investment Recommendations")
 
-            recommended_sip = int(monthly_income * 0.15)
-
-            recommendations = [
-                f"💰 Current SIP: ₹{monthly_sip:,.0f} (15% of income) - Good allocation!",
-                f"📈 Consider adding international equity exposure for diversification",
-                f"🏦 Rebalance portfolio quarterly to maintain target allocation",
-                f"💎 Current gold allocation: 5% - Consider increasing to 10% for stability"
-            ]
-
-            for rec in recommendations:
-                st.info(rec)
+            for rec in _INVEST_RECS_TMPL:
+                st.info(rec.format(sip=monthly_sip))
 
             # SIP performance tracker
             st.markdown("#### 📊 SIP Performance Tracker")
@@ -843,23 +949,8 @@ class FixedJarvisFiApp:
 
             with col1:
                 # Credit score gauge
-                fig = go.Figure(go.Indicator(
-                    mode = "gauge+number",
-                    value = current_score,
-                    domain = {'x': [0, 1], 'y': [0, 1]},
-                    title = {'text': "Credit Score"},
-                    gauge = {
-                        'axis': {'range': [300, 850]},
-                        'bar': {'color': "darkblue"},
-                        'steps': [
-                            {'range': [300, 550], 'color': "red"},
-                            {'range': [550, 650], 'color': "orange"},
-                            {'range': [650, 750], 'color': "yellow"},
-                            {'range': [750, 850], 'color': "green"}
-                        ]
-                    }
-                ))
-                fig.update_layout(height=300)
+                fig = go.Figure(_credit_gauge_figure())
+                fig.update_traces(value=current_score)
                 st.plotly_chart(fig, use_container_width=True)
 
             with col2:
@@ -889,15 +980,7 @@ class FixedJarvisFiApp:
             # Credit improvement recommendations
             st.markdown("#### 💡 Improvement Recommendations")
 
-            recommendations = [
-                "💳 Keep credit utilization below 30%",
-                "⏰ Pay all bills on time",
-                "📅 Don't close old credit cards",
-                "🔍 Check credit report regularly",
-                "💰 Pay more than minimum amounts"
-            ]
-
-            for rec in recommendations:
+            for rec in _CREDIT_RECS:
                 st.info(rec)
 
         except Exception as e:
@@ -912,14 +995,7 @@ class FixedJarvisFiApp:
             # MSP Information
             st.markdown("#### 🌾 Minimum Support Price (MSP) Information")
 
-            msp_data = {
-                'Crop': ['Rice', 'Wheat', 'Cotton', 'Sugarcane', 'Maize', 'Bajra'],
-                'MSP (₹/Quintal)': [2183, 2275, 6620, 315, 2090, 2500],
-                'Season': ['Kharif', 'Rabi', 'Kharif', 'Annual', 'Kharif', 'Kharif']
-            }
-
-            df_msp = pd.DataFrame(msp_data)
-            st.dataframe(df_msp, use_container_width=True)
+            st.dataframe(_msp_df(), use_container_width=True)
 
             # Crop Loan Calculator
             st.markdown("#### 🏦 Crop Loan Calculator")
@@ -935,30 +1011,15 @@ class FixedJarvisFiApp:
                 loan_amount = min(total_cost, 300000)  # Max 3 lakh for small farmers
 
             with col2:
-                st.metric("Total Cultivation Cost", f"₹{total_cost:,}")
-                st.metric("Eligible Loan Amount", f"₹{loan_amount:,}")
+                st.metric("Total Cultivation Cost", _INR(total_cost))
+                st.metric("Eligible Loan Amount", _INR(loan_amount))
                 st.metric("Interest Rate", "7.0% p.a.")
                 st.metric("Repayment Period", "12 months")
 
             # Government Schemes
             st.markdown("#### 🏛️ Government Schemes")
 
-            schemes = [
-                {
-                    'name': 'PM-KISAN',
-                    'benefit': '₹6,000 per year',
-                    'eligibility': 'Small and marginal farmers',
-                    'status': 'Active'
-                },
-                {
-                    'name': 'Pradhan Mantri Fasal Bima Yojana',
-                    'benefit': 'Crop insurance coverage',
-                    'eligibility': 'All farmers',
-                    'status': 'Active'
-                }
-            ]
-
-            for scheme in schemes:
+            for scheme in _SCHEMES:
                 with st.expander(f"📋 {scheme['name']}"):
                     col1, col2 = st.columns(2)
                     with col1:
@@ -978,13 +1039,15 @@ class FixedJarvisFiApp:
         try:
             st.markdown("# 🎤 Voice Assistant")
 
+            profile = st.session_state.user_profile
+
             # Voice status
-            if st.session_state.user_profile['preferences']['voice_enabled']:
+            if profile['preferences']['voice_enabled']:
                 st.success("🟢 Voice interface is enabled")
             else:
                 st.warning("🟡 Voice interface is disabled")
                 if st.button("Enable Voice"):
-                    st.session_state.user_profile['preferences']['voice_enabled'] = True
+                    profile['preferences']['voice_enabled'] = True
                     st.rerun()
                 return
 
@@ -996,13 +1059,7 @@ class FixedJarvisFiApp:
                     with st.spinner("🎤 Listening..."):
                         time.sleep(2)
                         # Simulate voice recognition
-                        sample_queries = [
-                            "What's my budget status?",
-                            "How should I invest 10000 rupees?",
-                            "Calculate SIP for retirement planning"
-                        ]
-                        import random
-                        recognized_text = random.choice(sample_queries)
+                        recognized_text = random.choice(_SAMPLE_QUERIES)
 
                         st.success(f"🎤 Recognized: '{recognized_text}'")
 
@@ -1016,7 +1073,7 @@ class FixedJarvisFiApp:
 
                         response = self.generate_ai_response(
                             recognized_text,
-                            st.session_state.user_profile['basic_info']['language']
+                            profile['basic_info']['language']
                         )
                         st.session_state.chat_history.append(response)
 
@@ -1049,31 +1106,22 @@ class FixedJarvisFiApp:
     def run(self):
         """Main application runner"""
         try:
+            # Per-session setup
+            self.setup_page_config()
+            self.initialize_session_state()
+
             # Render sidebar
             self.render_sidebar()
 
             # Render main content based on current page
             current_page = st.session_state.current_page
 
-            if current_page == 'home':
-                self.render_home_page()
-            elif current_page == 'dashboard':
-                self.render_dashboard_page()
-            elif current_page == 'chat':
-                self.render_chat_page()
-            elif current_page == 'calculators':
-                self.render_calculators_page()
-            elif current_page == 'investments':
-                self.render_investments_page()
-            elif current_page == 'credit':
-                self.render_credit_page()
-            elif current_page == 'farmer':
-                self.render_farmer_page()
-            elif current_page == 'voice':
-                self.render_voice_page()
-            else:
+            render_page = self._pages.get(current_page)
+            if render_page is None:
                 st.error(f"Unknown page: {current_page}")
-                self.render_home_page()
+                render_page = self.render_home_page
+
+            render_page()
 
         except Exception as e:
             self.logger.error(f"Application run failed: {e}")
@@ -1083,10 +1131,16 @@ class FixedJarvisFiApp:
             st.code(f"Current page: {st.session_state.get('current_page', 'Unknown')}")
 
 
+@st.cache_resource
+def _get_app() -> FixedJarvisFiApp:
+    """Construct the application once per process"""
+    return FixedJarvisFiApp()
+
+
 def main():
     """Main function to run the fixed JarvisFi application"""
     try:
-        app = FixedJarvisFiApp()
+        app = _get_app()
         app.run()
     except Exception as e:
         st.error(f"Application startup failed: {e}")
@@ -0,0 +1,57 @@
+"""
+Chat Topic Detection Tests
+Pins the keyword matching that picks the AI chat reply templates
+"""
+
+import pytest
+import sys
+import os
+
+# Add project paths
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'frontend'))
+
+from restored_jarvisfi_app import _chat_topic
+
+
+class TestChatTopicDetection:
+    """Test chat topic detection in the restored app"""
+
+    @pytest.mark.parametrize("message, topic", [
+        # Phrases the original substring checks matched
+        ("how should i invest?", 'invest'),
+        ("best investment for me", 'invest'),
+        ("which mutual fund is good", 'invest'),
+        ("start a sip", 'invest'),
+        ("is this stock safe", 'invest'),
+        ("how to grow my savings", 'savings'),
+        ("i want to save more", 'savings'),
+        ("build an emergency fund", 'savings'),
+        ("should i take a loan", 'loan'),
+        ("what emi can i afford", 'loan'),
+        ("home loan or rent", 'loan'),
+        ("personal loan rates", 'loan'),
+        # Inflections and plurals
+        ("i invested 50k, what next?", 'invest'),
+        ("tips for new investors", 'invest'),
+        ("my investor's checklist", 'invest'),
+        ("are sips better than lump sum", 'invest'),
+        ("stocks or bonds", 'invest'),
+        ("i saved 10k this month", 'savings'),
+        ("saving for a car", 'savings'),
+        ("i loaned money to a friend", 'loan'),
+        ("too many emis", 'loan'),
+    ])
+    def test_topic_keywords(self, message, topic):
+        """Messages naming a topic select its templates"""
+        assert _chat_topic(message) == topic
+
+    def test_topic_priority(self):
+        """Investing wins over savings, and savings over loans, as in the original elif chain"""
+        assert _chat_topic("should i save or invest") == 'invest'
+        assert _chat_topic("save money to repay my loan") == 'savings'
+
+    def test_default_topic(self):
+        """Messages without topic keywords get the general replies"""
+        assert _chat_topic("hello there") == 'default'
+        assert _chat_topic("") == 'default'